@@ -8,8 +8,25 @@ I/O utility functions
 
 from __future__ import annotations
 
+import codecs
+import hashlib
 from itertools import islice
 
+#: Candidate decimal separators and delimiters, in order of preference
+DECIMALS_AND_DELIMITERS = (
+    (".", ","),
+    (".", ";"),
+    (".", r"\s+"),
+    (",", ";"),
+    (",", r"\s+"),
+)
+
+#: Formats found by :func:`guess_numeric_text_format`, indexed by a hash of the
+#: structure of the file sample (i.e. without digits): files of a batch sharing the
+#: same layout are then checked against the right candidate first
+_GUESSED_FORMATS: dict[bytes, tuple[str, str, str]] = {}
+_GUESSED_FORMATS_MAXSIZE = 128
+
 
 def count_lines(filename: str) -> int:
     """Count the number of lines in a file
@@ -48,3 +65,116 @@ def read_first_n_lines(filename: str, n: int = 100000) -> str:
         except UnicodeDecodeError:
             pass
     raise IOError(f"Cannot read file {filename}")
+
+
+def read_sample(filename: str, size: int = 65536) -> bytes:
+    """Read a sample of raw bytes at the beginning of a file
+
+    Args:
+        filename: File name
+        size: Maximum number of bytes to read
+
+    Returns:
+        The first bytes of the file
+    """
+    with open(filename, "rb") as file:
+        return file.read(size)
+
+
+def decode_sample(sample: bytes) -> tuple[str, str]:
+    """Decode a sample of raw bytes, guessing its encoding
+
+    The sample may be truncated in the middle of a multi-byte character: the
+    incomplete trailing character is then ignored.
+
+    Args:
+        sample: Raw bytes, e.g. as returned by :func:`read_sample`
+
+    Returns:
+        Tuple (text, encoding), encoding being one of "utf-8-sig", "utf-8" or
+        "latin-1" (the latter never fails)
+    """
+    encoding = "utf-8-sig" if sample.startswith(codecs.BOM_UTF8) else "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        return decoder.decode(sample, final=False), encoding
+    except UnicodeDecodeError:
+        return sample.decode("latin-1"), "latin-1"
+
+
+def _is_numeric_table(lines: list[str], decimal: str, delimiter: str) -> bool:
+    """Return True if lines may be parsed as a numeric table
+
+    Args:
+        lines: Non-empty lines of text
+        decimal: Decimal separator
+        delimiter: Delimiter (regular expression "\\s+" for any whitespace)
+
+    Returns:
+        True if all fields are numbers (or empty), and if no line has more fields
+        than the first one
+    """
+    ncols = None
+    for line in lines:
+        if delimiter == r"\s+":
+            fields = line.split()
+        else:
+            fields = line.split(delimiter)
+        if ncols is None:
+            ncols = len(fields)
+        elif len(fields) > ncols:
+            return False
+        for field in fields:
+            field = field.strip()
+            if not field:
+                continue
+            if decimal != ".":
+                if "." in field:
+                    return False
+                field = field.replace(decimal, ".")
+            try:
+                float(field)
+            except ValueError:
+                return False
+    return ncols is not None
+
+
+def guess_numeric_text_format(
+    filename: str, size: int = 65536, nlines: int = 10
+) -> tuple[str, str, str] | None:
+    """Guess the format of a text file containing a numeric table (no header),
+    by parsing a small sample at the beginning of the file
+
+    Candidates are tried in the order of :data:`DECIMALS_AND_DELIMITERS`, except
+    that the format previously found for a sample with the same structure (i.e.
+    the same text apart from digits) is tried first.
+
+    Args:
+        filename: File name
+        size: Maximum number of bytes of the sample
+        nlines: Maximum number of lines of the sample to be parsed
+
+    Returns:
+        Tuple (encoding, decimal, delimiter), or None if format could not be guessed
+    """
+    sample = read_sample(filename, size)
+    key = hashlib.blake2b(
+        sample[:4096].translate(None, b"0123456789"), digest_size=8
+    ).digest()
+    text, encoding = decode_sample(sample)
+    lines = text.splitlines()
+    if len(sample) == size and lines:
+        # The last line is probably truncated
+        lines.pop()
+    lines = [line for line in lines[:nlines] if line.strip()]
+    candidates = DECIMALS_AND_DELIMITERS
+    previous = _GUESSED_FORMATS.get(key)
+    if previous is not None and previous[0] == encoding:
+        candidates = (previous[1:],) + candidates
+    for decimal, delimiter in candidates:
+        if _is_numeric_table(lines, decimal, delimiter):
+            if len(_GUESSED_FORMATS) >= _GUESSED_FORMATS_MAXSIZE:
+                _GUESSED_FORMATS.clear()
+            _GUESSED_FORMATS[key] = encoding, decimal, delimiter
+            return encoding, decimal, delimiter
+    return None
@@ -7,22 +7,29 @@ Sigima I/O image formats
 from __future__ import annotations
 
 import os.path as osp
+import warnings
+from itertools import islice
 
 import imageio.v3 as iio
 import numpy as np
 import pandas as pd
 import scipy.io as sio
-import skimage.io
+import tifffile
 
 from sigima.config import _, options
 from sigima.io import ftlab
 from sigima.io.base import FormatInfo
+from sigima.io.common import textreader
 from sigima.io.common.converters import convert_array_to_standard_type
 from sigima.io.image import funcs
 from sigima.io.image.base import ImageFormatBase, MultipleImagesFormatBase
 from sigima.objects.image import ImageObj
+from sigima.tools.datatypes import clip_astype
 from sigima.worker import CallbackWorkerProtocol
 
+#: ITU-R BT.709 luma coefficients (same as :func:`skimage.color.rgb2gray`)
+RGB_TO_LUMA = np.array([0.2125, 0.7154, 0.0721], dtype=np.float32)
+
 
 class ClassicsImageFormat(ImageFormatBase):
     """Object representing classic image file types"""
@@ -43,8 +50,40 @@ class ClassicsImageFormat(ImageFormatBase):
 
         Returns:
             Image array data
+
+        .. note::
+
+            Grayscale images are returned as stored in the file (e.g. 8-bit or
+            16-bit integers), without any conversion. Color images are converted
+            to grayscale (luma) as float32 data: integer data is scaled to the
+            [0, 1] range, floating point data is kept in its original range.
+            RGBA images are first composited over a white background. As with
+            :func:`skimage.io.imread`, channels-first data (e.g. planar RGB TIFF
+            files) is recognized by a first dimension of 3 or 4 when the last one
+            is not. For multi-page files (e.g. TIFF stacks), only the first page is
+            read.
         """
-        return skimage.io.imread(filename, as_gray=True)
+        data = iio.imread(filename)
+        if data.ndim > 2 and data.shape[-1] not in (3, 4) and data.shape[-3] in (3, 4):
+            # Channels first (e.g. planar RGB TIFF): move channels last
+            data = np.moveaxis(data, -3, -1)
+        if data.ndim == 4 or (data.ndim == 3 and data.shape[-1] not in (3, 4)):
+            # Stack of images: only the first page is kept
+            data = data[0]
+        if data.ndim == 3:
+            # Color image: the intensity normalization of integer data is folded
+            # into the luma weights, so that the conversion is a single dot product
+            scale = np.float32(1.0)
+            if np.issubdtype(data.dtype, np.integer):
+                scale = np.float32(np.iinfo(data.dtype).max)
+            luma = np.dot(data[..., :3], RGB_TO_LUMA / scale)
+            if data.shape[-1] == 4:
+                # Alpha compositing over a white background (as `skimage.color.
+                # rgba2rgb`), applied to the luma since the conversion is linear
+                alpha = data[..., 3] / scale
+                luma = alpha * luma + (1 - alpha) * RGB_TO_LUMA.sum()
+            data = luma
+        return data
 
     @staticmethod
     def write_data(filename: str, data: np.ndarray) -> None:
@@ -56,12 +95,17 @@ class ClassicsImageFormat(ImageFormatBase):
         """
         ext = osp.splitext(filename)[1].lower()
         if ext in (".bmp", ".jpg", ".jpeg", ".png"):
-            if data.dtype is not np.uint8:
-                data = data.astype(np.uint8)
-        if ext in (".jp2",):
+            if data.dtype != np.uint8:
+                data = clip_astype(data, np.uint8)
+        elif ext in (".jp2",):
             if data.dtype not in (np.uint8, np.uint16):
-                data = data.astype(np.uint16)
-        skimage.io.imsave(filename, data, check_contrast=False)
+                data = clip_astype(data, np.uint16)
+        elif data.dtype == bool:
+            data = data.astype(np.uint8) * 255
+        if ext in (".tif", ".tiff"):
+            tifffile.imwrite(filename, data)
+        else:
+            iio.imwrite(filename, data)
 
 
 class NumPyImageFormat(ImageFormatBase):
@@ -117,24 +161,87 @@ class TextImageFormat(ImageFormatBase):
         Returns:
             Image array data
         """
+        # Fast path: guess the file format from a small sample, and read it once
+        text_format = textreader.guess_numeric_text_format(filename)
+        if text_format is not None:
+            try:
+                return TextImageFormat.read_text_data(filename, *text_format)
+            except ValueError:
+                pass
+        # Slow path: try all supported formats, until one of them works
         for encoding in ("utf-8", "utf-8-sig", "latin-1"):
-            for decimal in (".", ","):
-                for delimiter in (",", ";", r"\s+"):
-                    try:
-                        df = pd.read_csv(
-                            filename,
-                            decimal=decimal,
-                            delimiter=delimiter,
-                            encoding=encoding,
-                            header=None,
-                        )
-                        # Handle the extra column created with trailing delimiters.
-                        df = df.dropna(axis=1, how="all")
-                        return df.to_numpy(np.float64)
-                    except ValueError:
-                        continue
+            for decimal, delimiter in textreader.DECIMALS_AND_DELIMITERS:
+                try:
+                    return TextImageFormat.read_text_data(
+                        filename, encoding, decimal, delimiter
+                    )
+                except ValueError:
+                    continue
         raise ValueError(f"Could not read image data from file {filename}.")
 
+    @staticmethod
+    def read_text_data(
+        filename: str, encoding: str, decimal: str, delimiter: str
+    ) -> np.ndarray:
+        """Read data from text file with a known format
+
+        Args:
+            filename: File name
+            encoding: File encoding
+            decimal: Decimal separator
+            delimiter: Delimiter
+
+        Returns:
+            Image array data
+
+        Raises:
+            ValueError: if data could not be read with this format
+        """
+        # NumPy's C parser is much faster than pandas for a plain numeric table,
+        # but it does not handle empty fields (e.g. trailing delimiters) or lines
+        # with a different number of fields: pandas is used in those cases.
+        # NumPy has no decimal separator option: when it is not ".", the lines are
+        # translated on the fly, and any "." is made invalid so that fields such as
+        # "1.5" or "1.234,5" fail to parse (as in the format guessing step).
+        loadtxt_delimiter = None if delimiter == r"\s+" else delimiter
+        data = None
+        try:
+            with warnings.catch_warnings():
+                # Empty files are only reported by a warning: see size check below
+                warnings.simplefilter("ignore", UserWarning)
+                if decimal == ".":
+                    data = np.loadtxt(
+                        filename,
+                        dtype=np.float64,
+                        delimiter=loadtxt_delimiter,
+                        encoding=encoding,
+                        ndmin=2,
+                    )
+                elif decimal != delimiter:
+                    table = str.maketrans({".": "?", decimal: "."})
+                    with open(filename, encoding=encoding) as file:
+                        data = np.loadtxt(
+                            (line.translate(table) for line in file),
+                            dtype=np.float64,
+                            delimiter=loadtxt_delimiter,
+                            ndmin=2,
+                        )
+        except ValueError:
+            pass
+        if data is not None and data.size > 0:
+            return data
+        # Fallback to pandas (which raises an error on empty files, as expected)
+        df = pd.read_csv(
+            filename,
+            decimal=decimal,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=None,
+        )
+        # Handle the extra column created with trailing delimiters.
+        df = df.dropna(axis=1, how="all")
+        return df.to_numpy(np.float64)
+
     @staticmethod
     def write_data(filename: str, data: np.ndarray) -> None:
         """Write data to file.
@@ -182,7 +289,14 @@ class MatImageFormat(ImageFormatBase):
         Returns:
             List of image objects
         """
-        mat = sio.loadmat(filename)
+        if funcs.is_mat73_file(filename):
+            mat = funcs.read_mat73_arrays(filename)
+        else:
+            # Only 2D variables are loaded (variables of other shapes are ignored)
+            names = [
+                name for name, shape, _cls in sio.whosmat(filename) if len(shape) == 2
+            ]
+            mat = sio.loadmat(filename, variable_names=names)
         allimg: list[ImageObj] = []
         for dname, data in mat.items():
             if dname.startswith("__") or not isinstance(data, np.ndarray):
@@ -267,6 +381,63 @@ class AndorSIFImageFormat(MultipleImagesFormatBase):
 
 
 # Generate classes based on the information above:
+class ImageIOFormatBase(MultipleImagesFormatBase):
+    """Base image format object for formats read through imageio
+
+    Images are the same as with ``iio.imread(filename, index=None)``: when the plugin
+    reads a batch of images (e.g. pages of a legacy plugin), frames are decoded one at
+    a time instead of being stacked first; otherwise, the single image returned by the
+    plugin (e.g. first series of a TIFF file) is read and split if it is a stack.
+    """
+
+    @staticmethod
+    def read_data(filename: str) -> np.ndarray:
+        """Read data and return it
+
+        Args:
+            filename: File name
+
+        Returns:
+            Image array data
+        """
+        return iio.imread(filename, index=None)
+
+    def read(
+        self, filename: str, worker: CallbackWorkerProtocol | None = None
+    ) -> list[ImageObj]:
+        """Read list of image objects from file
+
+        Args:
+            filename: File name
+            worker: Callback worker object
+
+        Returns:
+            List of image objects
+        """
+        with iio.imopen(filename, "r") as image_file:
+            props = image_file.properties(index=None)
+            if props.is_batch:
+                nframes = props.n_images or props.shape[0]
+                frames = image_file.iter()
+            else:
+                data = image_file.read(index=None)
+                if data.ndim != 3:
+                    obj = self.create_object(filename)
+                    obj.data = data
+                    return [obj]
+                nframes, frames = data.shape[0], iter(data)
+            objlist = []
+            for idx, data in enumerate(islice(frames, nframes)):
+                obj = self.create_object(filename, index=idx)
+                obj.data = data
+                objlist.append(obj)
+                if worker is not None:
+                    worker.set_progress((idx + 1) / nframes)
+                    if worker.was_canceled():
+                        break
+        return objlist
+
+
 def generate_imageio_format_classes(
     imageio_formats: list[list[str, str]]
     | list[tuple[str, str]]
@@ -283,14 +454,9 @@ def generate_imageio_format_classes(
             "FORMAT_INFO": FormatInfo(
                 name=name, extensions=extensions, readable=True, writeable=False
             ),
-            "read_data": staticmethod(
-                lambda filename: iio.imread(filename, index=None)
-            ),
         }
         class_name = extensions.split()[0].split(".")[1].upper() + "ImageFormat"
-        globals()[class_name] = type(
-            class_name, (MultipleImagesFormatBase,), class_dict
-        )
+        globals()[class_name] = type(class_name, (ImageIOFormatBase,), class_dict)
 
 
 generate_imageio_format_classes()
@@ -344,7 +510,7 @@ class XYZImageFormat(ImageFormatBase):
             rows = int(np.fromfile(fdesc, dtype=np.uint16, count=1)[0])
             arr = np.fromfile(fdesc, dtype=np.uint16, count=cols * rows)
             arr = arr.reshape((rows, cols))
-        return np.fliplr(arr)
+        return arr[:, ::-1]
 
 
 class FTLabImageFormat(ImageFormatBase):
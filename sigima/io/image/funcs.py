@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os
 import re
+import struct
 import sys
 import time
 
@@ -352,10 +353,46 @@ def imread_scor(filename: str) -> np.ndarray:
     return scor_file.read_all()
 
 
+#: Pixel Data element tag (7FE0,0010), as encoded in little/big endian files
+DICOM_PIXEL_DATA_TAGS = {"<": b"\xe0\x7f\x10\x00", ">": b"\x7f\xe0\x00\x10"}
+
+
+def get_dicom_pixel_data_location(
+    header: bytes, is_implicit_vr: bool, is_little_endian: bool
+) -> tuple[int, int, str] | None:
+    """Parse the header of a DICOM Pixel Data element
+
+    Args:
+        header: The first 12 bytes of the Pixel Data element
+        is_implicit_vr: True if the dataset is encoded with implicit VR
+        is_little_endian: True if the dataset is encoded in little endian
+
+    Returns:
+        Tuple (data offset relative to the element, data length in bytes, byte
+        order) or None if the element is not a native (uncompressed) Pixel Data
+        element
+    """
+    byteorder = "<" if is_little_endian else ">"
+    if header[:4] != DICOM_PIXEL_DATA_TAGS[byteorder]:
+        return None
+    if is_implicit_vr:  # Implicit VR: tag, length
+        offset, (length,) = 8, struct.unpack(byteorder + "I", header[4:8])
+    else:
+        # Explicit VR: tag, VR, 0x0000, length (Pixel Data VRs, i.e. OB, OW or UN,
+        # all have a 4-byte length field)
+        offset, (length,) = 12, struct.unpack(byteorder + "I", header[8:12])
+    if length == 0xFFFFFFFF:  # Undefined length: encapsulated (compressed) data
+        return None
+    return offset, length, byteorder
+
+
 # Original code: see PlotPy package (BSD 3-Clause license)
 def imread_dicom(filename: str) -> np.ndarray:
     """Open DICOM image with pydicom and return a NumPy array
 
+    For uncompressed pixel data, only the header is parsed by pydicom: pixel data
+    is then read from the file straight into a NumPy array.
+
     Args:
         filename: path to DICOM file
 
@@ -366,28 +403,56 @@ def imread_dicom(filename: str) -> np.ndarray:
     # pylint: disable=import-error
     from pydicom import dcmread  # type:ignore
 
-    dcm = dcmread(filename, force=True)
+    with open(filename, "rb") as dcm_file:
+        dcm = dcmread(dcm_file, force=True, stop_before_pixels=True)
+        element_offset = dcm_file.tell()
+        location = None
+        if dcm.is_implicit_VR is not None and dcm.is_little_endian is not None:
+            location = get_dicom_pixel_data_location(
+                dcm_file.read(12), dcm.is_implicit_VR, dcm.is_little_endian
+            )
+        if location is None:
+            # Pixel data must be decoded by pydicom
+            dcm_file.seek(0)
+            dcm = dcmread(dcm_file, force=True)
+            buffer, offset, length = dcm.PixelData, 0, len(dcm.PixelData)
+            try:
+                # pydicom 0.9.3:
+                dcm_is_little_endian = dcm.isLittleEndian
+            except AttributeError:
+                # pydicom 0.9.4:
+                dcm_is_little_endian = dcm.is_little_endian
+            byteorder = "<" if dcm_is_little_endian else ">"
+        else:
+            offset, length, byteorder = location
+            dcm_file.seek(element_offset + offset)
+            buffer, offset = np.fromfile(dcm_file, np.uint8, count=length), 0
     # **********************************************************************
     # The following is necessary until pydicom numpy support is improved:
     # (after that, a simple: 'arr = dcm.PixelArray' will work the same)
-    format_str = f"{'u' if dcm.PixelRepresentation == 0 else ''}int{dcm.BitsAllocated}"
-    try:
-        dtype = np.dtype(format_str)
-    except TypeError as exc:
-        raise TypeError(
-            f"Data type not understood by NumPy: "
-            f"PixelRepresentation={dcm.PixelRepresentation}, "
-            f"BitsAllocated={dcm.BitsAllocated}"
-        ) from exc
-    arr = np.frombuffer(dcm.PixelData, dtype)
-    try:
-        # pydicom 0.9.3:
-        dcm_is_little_endian = dcm.isLittleEndian
-    except AttributeError:
-        # pydicom 0.9.4:
-        dcm_is_little_endian = dcm.is_little_endian
-    if dcm_is_little_endian != (sys.byteorder == "little"):
-        arr.byteswap(True)
+    if dcm.BitsAllocated == 1:
+        nframes = int(getattr(dcm, "NumberOfFrames", 1) or 1)
+        bits = np.frombuffer(buffer, np.uint8, count=length, offset=offset)
+        arr = np.unpackbits(bits, bitorder="little")
+        arr = arr[: nframes * dcm.Rows * dcm.Columns]
+    else:
+        format_str = (
+            f"{'u' if dcm.PixelRepresentation == 0 else ''}int{dcm.BitsAllocated}"
+        )
+        try:
+            dtype = np.dtype(format_str)
+        except TypeError as exc:
+            raise TypeError(
+                f"Data type not understood by NumPy: "
+                f"PixelRepresentation={dcm.PixelRepresentation}, "
+                f"BitsAllocated={dcm.BitsAllocated}"
+            ) from exc
+        count = length // dtype.itemsize
+        arr = np.frombuffer(
+            buffer, dtype.newbyteorder(byteorder), count=count, offset=offset
+        )
+        if (byteorder == "<") != (sys.byteorder == "little"):
+            arr = arr.astype(dtype)
     spp = getattr(dcm, "SamplesperPixel", 1)
     if hasattr(dcm, "NumberOfFrames") and dcm.NumberOfFrames > 1:
         if spp > 1:
@@ -406,3 +471,54 @@ def imread_dicom(filename: str) -> np.ndarray:
             arr = arr.reshape(dcm.Rows, dcm.Columns)
     # **********************************************************************
     return arr
+
+
+# ==============================================================================
+# MAT-File I/O functions
+# ==============================================================================
+
+
+def is_mat73_file(filename: str) -> bool:
+    """Return True if file is a MATLAB 7.3 MAT-file (HDF5-based)
+
+    Args:
+        filename: path to MAT-file
+
+    Returns:
+        True if file is a MATLAB 7.3 MAT-file
+    """
+    with open(filename, "rb") as mat_file:
+        return mat_file.read(128).startswith(b"MATLAB 7.3")
+
+
+def read_mat73_arrays(filename: str) -> dict[str, np.ndarray]:
+    """Read all 2D numeric arrays stored at the root of a MATLAB 7.3 MAT-file
+
+    MATLAB 7.3 MAT-files are HDF5 files which are not supported by
+    :py:func:`scipy.io.loadmat`: they are read with h5py.
+
+    Args:
+        filename: path to MAT-file
+
+    Returns:
+        Dictionary of arrays (variable name -> data)
+    """
+    # pylint: disable=import-outside-toplevel
+    import h5py
+
+    arrays = {}
+    with h5py.File(filename, "r") as h5file:
+        for name, dset in h5file.items():
+            if not isinstance(dset, h5py.Dataset) or dset.ndim != 2:
+                continue
+            dtype = dset.dtype
+            if dtype.names is not None and set(dtype.names) == {"real", "imag"}:
+                data = dset[()]
+                data = data["real"] + 1j * data["imag"]
+            elif dtype.kind in "biuf" and dset.attrs.get("MATLAB_class") != b"char":
+                data = dset[()]
+            else:
+                continue
+            # MATLAB arrays are stored in column-major order
+            arrays[name] = data.T
+    return arrays
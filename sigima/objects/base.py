@@ -257,6 +257,21 @@ class BaseResult(abc.ABC):
         """Return DataFrame from properties array"""
         return pd.DataFrame(self.shown_array, columns=list(self.headers))
 
+    def get_value(self, header: str, row: int = 0) -> float:
+        """Return a single value of shown results, without building a DataFrame
+
+        Args:
+            header: Column header (see :py:attr:`headers`)
+            row: Row index (i.e. result index, default: 0)
+
+        Returns:
+            Value
+
+        Raises:
+            ValueError: if header is not found
+        """
+        return float(self.shown_array[row, list(self.headers).index(header)])
+
     @property
     @abc.abstractmethod
     def shown_array(self) -> np.ndarray:
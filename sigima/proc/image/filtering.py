@@ -26,10 +26,9 @@ and removing noise prior to further analysis.
 from __future__ import annotations
 
 import guidata.dataset as gds
-import scipy.ndimage as spi
 import scipy.signal as sps
-from skimage import filters
 
+import sigima.tools.image as alg
 from sigima.config import _
 from sigima.objects.image import ImageObj
 from sigima.proc import computation_function
@@ -40,12 +39,11 @@ from sigima.proc.base import (
     dst_1_to_1,
 )
 from sigima.proc.image.base import Wrap1to1Func, restore_data_outside_roi
-from sigima.tools.image import freq_fft_filter
 
 
 @computation_function()
 def gaussian_filter(src: ImageObj, p: GaussianParam) -> ImageObj:
-    """Compute gaussian filter with :py:func:`scipy.ndimage.gaussian_filter`
+    """Compute gaussian filter with :py:func:`sigima.tools.image.gaussian_filter`
 
     Args:
         src: input image object
@@ -54,12 +52,12 @@ def gaussian_filter(src: ImageObj, p: GaussianParam) -> ImageObj:
     Returns:
         Output image object
     """
-    return Wrap1to1Func(spi.gaussian_filter, sigma=p.sigma)(src)
+    return Wrap1to1Func(alg.gaussian_filter, sigma=p.sigma)(src)
 
 
 @computation_function()
 def moving_average(src: ImageObj, p: MovingAverageParam) -> ImageObj:
-    """Compute moving average with :py:func:`scipy.ndimage.uniform_filter`
+    """Compute moving average with :py:func:`sigima.tools.image.uniform_filter`
 
     Args:
         src: input image object
@@ -68,12 +66,12 @@ def moving_average(src: ImageObj, p: MovingAverageParam) -> ImageObj:
     Returns:
         Output image object
     """
-    return Wrap1to1Func(spi.uniform_filter, size=p.n, mode=p.mode)(src)
+    return Wrap1to1Func(alg.uniform_filter, size=p.n, mode=p.mode)(src)
 
 
 @computation_function()
 def moving_median(src: ImageObj, p: MovingMedianParam) -> ImageObj:
-    """Compute moving median with :py:func:`scipy.ndimage.median_filter`
+    """Compute moving median with :py:func:`sigima.tools.image.median_filter`
 
     Args:
         src: input image object
@@ -82,7 +80,7 @@ def moving_median(src: ImageObj, p: MovingMedianParam) -> ImageObj:
     Returns:
         Output image object
     """
-    return Wrap1to1Func(spi.median_filter, size=p.n, mode=p.mode)(src)
+    return Wrap1to1Func(alg.median_filter, size=p.n, mode=p.mode)(src)
 
 
 @computation_function()
@@ -123,7 +121,7 @@ class ButterworthParam(gds.DataSet):
 
 @computation_function()
 def butterworth(src: ImageObj, p: ButterworthParam) -> ImageObj:
-    """Compute Butterworth filter with :py:func:`skimage.filters.butterworth`
+    """Compute Butterworth filter with :py:func:`sigima.tools.image.butterworth`
 
     Args:
         src: input image object
@@ -137,7 +135,7 @@ def butterworth(src: ImageObj, p: ButterworthParam) -> ImageObj:
         "butterworth",
         f"cut_off={p.cut_off:.3f}, order={p.order}, high_pass={p.high_pass}",
     )
-    dst.data = filters.butterworth(src.data, p.cut_off, p.high_pass, p.order)
+    dst.data = alg.butterworth(src.data, p.cut_off, p.high_pass, p.order)
     restore_data_outside_roi(dst, src)
     return dst
 
@@ -183,6 +181,6 @@ def freq_fft(src: ImageObj, p: FreqFFTParam) -> ImageObj:
         "freq_fft",
         f"f0={p.f0:.3f}, sigma={p.sigma:.3f}, type={p.ifft_result_type}",
     )
-    dst.data = freq_fft_filter(src.data, p.f0, p.sigma, p.ifft_result_type)
+    dst.data = alg.freq_fft_filter(src.data, p.f0, p.sigma, p.ifft_result_type)
     restore_data_outside_roi(dst, src)
     return dst
@@ -0,0 +1,43 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Classic image formats unit test
+
+Testing the conversion of color images to grayscale when reading classic formats.
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import numpy as np
+import tifffile
+
+from sigima.io import read_images
+from sigima.io.image.formats import RGB_TO_LUMA
+from sigima.tests import helpers
+from sigima.tests.env import execenv
+
+
+def test_read_planar_rgb_tiff() -> None:
+    """Test reading planar (channels-first) RGB TIFF files"""
+    rgb = np.random.default_rng(0).integers(0, 255, (20, 30, 3), dtype=np.uint8)
+    expected = np.dot(rgb, RGB_TO_LUMA / np.float32(255))
+    with helpers.WorkdirRestoringTempDir() as tmpdir:
+        # Planar RGB data is read back channels-first, i.e. with shape (3, H, W)
+        for planarconfig, data in (
+            ("contig", rgb),
+            ("separate", np.moveaxis(rgb, -1, 0)),
+        ):
+            filename = osp.join(tmpdir, f"rgb_{planarconfig}.tif")
+            tifffile.imwrite(
+                filename, data, photometric="rgb", planarconfig=planarconfig
+            )
+            execenv.print(f"Reading {planarconfig} RGB TIFF file:", filename)
+            objs = read_images(filename)
+            assert len(objs) == 1
+            helpers.check_array_result(planarconfig, objs[0].data, expected)
+
+
+if __name__ == "__main__":
+    test_read_planar_rgb_tiff()
@@ -0,0 +1,52 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+MATLAB 7.3 MAT-file unit test
+
+Testing the reading of HDF5-based MAT-files, which are not supported by SciPy.
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+
+from sigima.io import read_images
+from sigima.tests import helpers
+from sigima.tests.env import execenv
+
+
+def write_mat73_file(filename: str, arrays: dict[str, np.ndarray]) -> None:
+    """Write arrays to a file mimicking the layout of a MATLAB 7.3 MAT-file
+
+    Args:
+        filename: path to MAT-file
+        arrays: dictionary of arrays (variable name -> data)
+    """
+    with h5py.File(filename, "w", userblock_size=512) as h5file:
+        for name, data in arrays.items():
+            dset = h5file.create_dataset(name, data=data.T)
+            dset.attrs["MATLAB_class"] = np.bytes_("double")
+        h5file.create_dataset("vector", data=np.arange(10.0))
+    with open(filename, "r+b") as fdesc:
+        fdesc.write(b"MATLAB 7.3 MAT-file, Platform: GLNXA64".ljust(128))
+
+
+def test_read_mat73() -> None:
+    """Test reading MATLAB 7.3 MAT-files"""
+    rng = np.random.default_rng(0)
+    arrays = {"img": rng.random((20, 30)), "other": rng.random((5, 7))}
+    with helpers.WorkdirRestoringTempDir() as tmpdir:
+        filename = osp.join(tmpdir, "test73.mat")
+        write_mat73_file(filename, arrays)
+        objs = read_images(filename)
+        execenv.print(f"Read {len(objs)} images from MATLAB 7.3 MAT-file")
+        assert len(objs) == len(arrays)
+        for obj, (name, data) in zip(objs, arrays.items()):
+            helpers.check_array_result(name, obj.data, data)
+
+
+if __name__ == "__main__":
+    test_read_mat73()
@@ -0,0 +1,100 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Text reader unit test
+
+Testing the guessing of numeric text file formats (encoding, decimal separator and
+delimiter), and the reading of text image files.
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import numpy as np
+import pytest
+
+from sigima.io.common import textreader
+from sigima.io.common.textreader import guess_numeric_text_format
+from sigima.io.image.formats import TextImageFormat
+from sigima.tests import helpers
+from sigima.tests.env import execenv
+
+
+def test_guess_numeric_text_format() -> None:
+    """Test guessing numeric text file formats"""
+    data = np.array([[1.5, -2.0, 3.25], [4.0, 5.5, 6.0]])
+    contents = {
+        "dot_comma.csv": ("1.5,-2,3.25\n4,5.5,6\n", "utf-8", ".", ","),
+        "dot_trailing.csv": ("1.5,-2,3.25,\n4,5.5,6,\n", "utf-8", ".", ","),
+        "dot_semicolon.csv": ("1.5;-2;3.25\n4;5.5;6\n", "utf-8", ".", ";"),
+        "dot_space.txt": ("1.5 -2 3.25\n4 5.5 6\n", "utf-8", ".", r"\s+"),
+        "comma_semicolon.csv": ("1,5;-2;3,25\n4;5,5;6\n", "utf-8", ",", ";"),
+        "comma_tab.txt": ("1,5\t-2\t3,25\n4\t5,5\t6\n", "utf-8", ",", r"\s+"),
+        "bom.csv": ("\ufeff1.5,-2,3.25\n4,5.5,6\n", "utf-8-sig", ".", ","),
+    }
+    with helpers.WorkdirRestoringTempDir() as tmpdir:
+        for fname, (text, encoding, decimal, delimiter) in contents.items():
+            path = osp.join(tmpdir, fname)
+            with open(path, "w", encoding="utf-8") as fdesc:
+                fdesc.write(text)
+            execenv.print(f"{fname}: ", end="")
+            text_format = guess_numeric_text_format(path)
+            execenv.print(text_format)
+            assert text_format == (encoding, decimal, delimiter)
+            helpers.check_array_result(fname, TextImageFormat.read_data(path), data)
+        path = osp.join(tmpdir, "header.csv")
+        with open(path, "w", encoding="utf-8") as fdesc:
+            fdesc.write("x,y,z\n1,2,3\n")
+        assert guess_numeric_text_format(path) is None
+        for fname, text in (("empty.txt", ""), ("blank.csv", "\n  \n\n")):
+            path = osp.join(tmpdir, fname)
+            with open(path, "w", encoding="utf-8") as fdesc:
+                fdesc.write(text)
+            with pytest.raises(ValueError):
+                TextImageFormat.read_data(path)
+        # Mixed decimal separators are rejected, even when reading with a known format
+        path = osp.join(tmpdir, "mixed.txt")
+        with open(path, "w", encoding="utf-8") as fdesc:
+            fdesc.write("1.5 2.5\n3,5 4\n")
+        assert guess_numeric_text_format(path) is None
+        with pytest.raises(ValueError):
+            TextImageFormat.read_text_data(path, "utf-8", ",", r"\s+")
+        with pytest.raises(ValueError):
+            TextImageFormat.read_data(path)
+
+
+def test_guessed_formats_cache() -> None:
+    """Test that the format guessed for a file layout is tried first afterwards"""
+    tried = []
+    is_numeric_table = textreader._is_numeric_table
+
+    def counting_is_numeric_table(lines: list[str], decimal: str, delimiter: str):
+        """Record the candidates tried by `guess_numeric_text_format`"""
+        tried.append((decimal, delimiter))
+        return is_numeric_table(lines, decimal, delimiter)
+
+    textreader._GUESSED_FORMATS.clear()
+    textreader._is_numeric_table = counting_is_numeric_table
+    try:
+        with helpers.WorkdirRestoringTempDir() as tmpdir:
+            path = osp.join(tmpdir, "comma_tab.txt")
+            with open(path, "w", encoding="utf-8") as fdesc:
+                fdesc.write("1,5\t-2\t3,25\n4\t5,5\t6\n")
+            text_format = guess_numeric_text_format(path)
+            # Last candidate: all candidates were tried, and the result was cached
+            assert tried == list(textreader.DECIMALS_AND_DELIMITERS)
+            assert list(textreader._GUESSED_FORMATS.values()) == [text_format]
+            # Same layout, other values: the cached format is the only one tried
+            with open(path, "w", encoding="utf-8") as fdesc:
+                fdesc.write("7,3\t-9\t8,12\n1\t0,5\t2\n")
+            tried.clear()
+            assert guess_numeric_text_format(path) == text_format
+            assert tried == [text_format[1:]]
+    finally:
+        textreader._is_numeric_table = is_numeric_table
+
+
+if __name__ == "__main__":
+    test_guess_numeric_text_format()
+    test_guessed_formats_cache()
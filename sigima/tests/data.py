@@ -278,18 +278,22 @@ def create_2d_gaussian(
     )
 
 
-def get_laser_spot_data() -> list[np.ndarray]:
-    """Return a list of NumPy arrays containing images which are relevant for
-    testing laser spot image processing features
+def get_laser_spot_data() -> Generator[np.ndarray, None, None]:
+    """Yield NumPy arrays containing images which are relevant for testing laser spot
+    image processing features
 
-    Returns:
-        List of NumPy arrays
+    Images are created or read one at a time, so that only the current one is kept
+    in memory.
+
+    Yields:
+        NumPy arrays
     """
     znoise = create_2d_random(2000, np.uint16)
     zgauss = create_2d_gaussian(2000, np.uint16, x0=2.0, y0=-3.0)
-    return [zgauss + znoise] + [
-        read_image(fname).data for fname in get_test_fnames("*.scor-data")
-    ]
+    yield zgauss + znoise
+    del znoise, zgauss
+    for fname in get_test_fnames("*.scor-data"):
+        yield read_image(fname).data
 
 
 class PeakDataParam(gds.DataSet):
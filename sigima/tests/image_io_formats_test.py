@@ -4,6 +4,8 @@
 Image I/O formats test
 """
 
+from __future__ import annotations
+
 # Note about the modules imported outside top-level:
 #
 # We want to keep the import order under control, so we import the modules only when
@@ -33,9 +35,88 @@ def test_imageio_formats_option():
     assert hasattr(formats, "RECImageFormat"), "RECImageFormat not found in formats"
 
 
+class RecordingWorker:
+    """Callback worker recording progress, canceling after `cancel_after` frames"""
+
+    def __init__(self, cancel_after: int | None = None) -> None:
+        self.cancel_after = cancel_after
+        self.progress: list[float] = []
+
+    def set_progress(self, value: float) -> None:
+        """Set progress"""
+        self.progress.append(value)
+
+    def was_canceled(self) -> bool:
+        """Return True if the worker was canceled"""
+        return self.cancel_after is not None and len(self.progress) >= self.cancel_after
+
+
+def test_imageio_frames_reading():
+    """Read single and multi-frame files through imageio, frame by frame"""
+    # pylint: disable=import-outside-toplevel
+    import os.path as osp
+
+    import imageio.v3 as iio
+    import numpy as np
+    import tifffile
+
+    from sigima.io.base import FormatInfo
+    from sigima.io.image import formats
+    from sigima.tests.helpers import WorkdirRestoringTempDir
+
+    class ImageIOTestFormatBase(formats.ImageIOFormatBase):
+        """Format read through imageio (not registered: name ends with FormatBase)"""
+
+        FORMAT_INFO = FormatInfo(
+            name="imageio", extensions="*.tif *.gif", readable=True, writeable=False
+        )
+
+    fmt = ImageIOTestFormatBase()
+    stack = np.random.default_rng(0).integers(0, 255, (3, 30, 40), dtype=np.uint8)
+    with WorkdirRestoringTempDir() as tmpdir:
+        # Single frame: one object, without index in its title
+        filename = osp.join(tmpdir, "single.tif")
+        iio.imwrite(filename, stack[0])
+        objs = fmt.read(filename, RecordingWorker())
+        assert len(objs) == 1 and objs[0].title == "single.tif"
+        np.testing.assert_array_equal(objs[0].data, stack[0])
+
+        # Stack: one object per frame, with progress reporting
+        filename = osp.join(tmpdir, "stack.tif")
+        iio.imwrite(filename, stack)
+        worker = RecordingWorker()
+        objs = fmt.read(filename, worker)
+        assert [obj.title for obj in objs] == [f"stack.tif {i:02d}" for i in range(3)]
+        for obj, expected in zip(objs, stack):
+            np.testing.assert_array_equal(obj.data, expected)
+        assert len(worker.progress) == 3 and worker.progress[-1] == 1.0
+
+        # Cancellation after the first frame
+        objs = fmt.read(filename, RecordingWorker(cancel_after=1))
+        assert len(objs) == 1
+
+        # Two series: only the first one is read (as with `iio.imread`)
+        filename = osp.join(tmpdir, "series.tif")
+        with tifffile.TiffWriter(filename) as tif:
+            tif.write(stack, photometric="minisblack")
+            tif.write(stack[0], photometric="minisblack")
+        objs = fmt.read(filename)
+        assert len(objs) == 3
+        assert objs[-1].data.shape == iio.imread(filename, index=None).shape[1:]
+
+        # Batch of pages (e.g. animated GIF): one object per page
+        filename = osp.join(tmpdir, "pages.gif")
+        iio.imwrite(filename, stack, loop=0)
+        worker = RecordingWorker()
+        objs = fmt.read(filename, worker)
+        assert len(objs) == len(iio.imread(filename, index=None)) == 3
+        assert worker.progress[-1] == 1.0
+
+
 if __name__ == "__main__":
     from pprint import pprint
 
     pprint(get_image_formats())
     test_imageio_formats_option()
+    test_imageio_frames_reading()
     pprint(get_image_formats())
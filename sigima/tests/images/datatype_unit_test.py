@@ -10,6 +10,8 @@ Unit tests for image data types
 
 from __future__ import annotations
 
+import warnings
+
 import numpy as np
 
 from sigima.objects import ImageDatatypes
@@ -63,6 +65,19 @@ def test_clip_astype():
         assert data2[0] == minval, txt
         execenv.print("OK")
 
+    # Test that NaN values do not prevent out-of-range values from being clipped
+    for dtype in get_integer_datatypes():
+        info = np.iinfo(dtype.value)
+        data = np.array([np.nan, info.max + 1.0e3, info.min - 1.0e3])
+        with warnings.catch_warnings():
+            # Casting NaN to an integer type emits a RuntimeWarning
+            warnings.simplefilter("ignore", RuntimeWarning)
+            data2 = clip_astype(data, dtype.value)
+        txt = f"Clipping with NaN: {dtype.value}"
+        execenv.print(txt, end="... ")
+        assert data2[1] == info.max and data2[2] == info.min, txt
+        execenv.print("OK")
+
 
 if __name__ == "__main__":
     test_clip_astype()
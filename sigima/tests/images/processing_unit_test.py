@@ -147,23 +147,33 @@ def test_image_offset_correction() -> None:
 def test_image_gaussian_filter() -> None:
     """Validation test for the image Gaussian filter processing."""
     src = get_test_image("flower.npy")
+    src_f32 = src.copy(dtype=np.float32)
     for sigma in (10.0, 50.0):
         p = sigima.params.GaussianParam.create(sigma=sigma)
         dst = sigima_image.gaussian_filter(src, p)
         exp = spi.gaussian_filter(src.data, sigma=sigma)
         check_array_result(f"GaussianFilter[sigma={sigma}]", dst.data, exp)
+        # Single precision data may be processed by OpenCV (if installed):
+        dst = sigima_image.gaussian_filter(src_f32, p)
+        exp = spi.gaussian_filter(src_f32.data, sigma=sigma)
+        check_array_result(f"GaussianFilter[sigma={sigma},float32]", dst.data, exp)
 
 
 @pytest.mark.validation
 def test_image_moving_average() -> None:
     """Validation test for the image moving average processing."""
     src = get_test_image("flower.npy")
+    src_f64 = src.copy(dtype=np.float64)
     p = sigima.params.MovingAverageParam.create(n=30)
     for mode in p.modes:
         p.mode = mode
         dst = sigima_image.moving_average(src, p)
         exp = spi.uniform_filter(src.data, size=p.n, mode=p.mode)
         check_array_result(f"MovingAvg[n={p.n},mode={p.mode}]", dst.data, exp)
+        # Floating point data may be processed by OpenCV (if installed):
+        dst = sigima_image.moving_average(src_f64, p)
+        exp = spi.uniform_filter(src_f64.data, size=p.n, mode=p.mode)
+        check_array_result(f"MovingAvg[n={p.n},mode={p.mode},float64]", dst.data, exp)
 
 
 @pytest.mark.validation
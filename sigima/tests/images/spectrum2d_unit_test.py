@@ -24,9 +24,10 @@ def test_image_spectrum_interactive():
     with qt_app_context():
         obj = get_test_image("NF 180338201.scor-data")
         data = obj.data
-        ms = alg.magnitude_spectrum(data, log_scale=True)
-        ps = alg.phase_spectrum(data)
-        psd = alg.psd(data, log_scale=True)
+        spectrum = alg.fft2d(data)  # Computed once for the three spectra
+        ms = alg.magnitude_spectrum(data, log_scale=True, spectrum=spectrum)
+        ps = alg.phase_spectrum(data, spectrum=spectrum)
+        psd = alg.psd(data, log_scale=True, spectrum=spectrum)
         images = [data, ms, ps, psd]
         titles = [
             "Original",
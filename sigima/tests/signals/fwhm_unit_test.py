@@ -64,20 +64,22 @@ def test_signal_fwhm() -> None:
     """Validation test for the full width at half maximum computation."""
     obj = cdltd.get_test_signal("fwhm.txt")
     real_fwhm = 2.675  # Manual validation
+    param = sigima.params.FWHMParam()  # Created once, and reused for all methods
     for method, exp in (
         ("gauss", 2.40323),
         ("lorentz", 2.78072),
         ("voigt", 2.56591),
         ("zero-crossing", real_fwhm),
     ):
-        param = sigima.params.FWHMParam.create(method=method)
-        df = sigima_signal.fwhm(obj, param).to_dataframe()
+        param.method = method
+        result = sigima_signal.fwhm(obj, param)
         sigima.tests.helpers.check_scalar_result(
-            f"FWHM[{method}]", df.L[0], exp, rtol=0.05
+            f"FWHM[{method}]", result.get_value("L"), exp, rtol=0.05
         )
     obj = cdltd.create_paracetamol_signal()
+    param.method = "zero-crossing"
     with pytest.warns(UserWarning):
-        sigima_signal.fwhm(obj, sigima.params.FWHMParam.create(method="zero-crossing"))
+        sigima_signal.fwhm(obj, param)
 
 
 @pytest.mark.validation
@@ -85,8 +87,10 @@ def test_signal_fw1e2() -> None:
     """Validation test for the full width at 1/e^2 maximum computation."""
     obj = cdltd.get_test_signal("fw1e2.txt")
     exp = 4.06  # Manual validation
-    df = sigima_signal.fw1e2(obj).to_dataframe()
-    sigima.tests.helpers.check_scalar_result("FW1E2", df.L[0], exp, rtol=0.005)
+    result = sigima_signal.fw1e2(obj)
+    sigima.tests.helpers.check_scalar_result(
+        "FW1E2", result.get_value("L"), exp, rtol=0.005
+    )
 
 
 @pytest.mark.validation
@@ -95,8 +99,10 @@ def test_signal_full_width_at_y() -> None:
     obj = cdltd.get_test_signal("fwhm.txt")
     real_fwhm = 2.675  # Manual validation
     param = sigima.params.OrdinateParam.create(y=0.5)
-    df = sigima_signal.full_width_at_y(obj, param).to_dataframe()
-    sigima.tests.helpers.check_scalar_result("∆X", df.L[0], real_fwhm, rtol=0.05)
+    result = sigima_signal.full_width_at_y(obj, param)
+    sigima.tests.helpers.check_scalar_result(
+        "∆X", result.get_value("L"), real_fwhm, rtol=0.05
+    )
 
 
 if __name__ == "__main__":
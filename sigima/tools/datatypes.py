@@ -21,6 +21,10 @@ def clip_astype(data: np.ndarray, dtype: np.dtype) -> np.ndarray:
     Returns:
         Array converted to new data type
     """
-    if np.issubdtype(dtype, np.integer):
-        return np.clip(data, np.iinfo(dtype).min, np.iinfo(dtype).max).astype(dtype)
+    if np.issubdtype(dtype, np.integer) and not np.can_cast(data.dtype, dtype):
+        info = np.iinfo(dtype)
+        # Clipping requires a temporary copy: skip it if values are already in range
+        # (NaN values must be ignored here, otherwise both comparisons are False)
+        if data.size > 0 and (np.nanmin(data) < info.min or np.nanmax(data) > info.max):
+            data = np.clip(data, info.min, info.max)
     return data.astype(dtype)
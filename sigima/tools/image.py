@@ -8,13 +8,15 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import functools
+from typing import Callable, Literal
 
 import numpy as np
+import scipy.fft as spfft
 import scipy.ndimage as spi
 import scipy.spatial as spt
 from numpy import ma
-from skimage import exposure, feature, measure, transform
+from skimage import exposure, feature, filters, measure, transform
 
 # MARK: Level adjustment ---------------------------------------------------------------
 
@@ -71,6 +73,196 @@ def normalize(
     raise ValueError(f"Unsupported parameter {parameter}")
 
 
+# MARK: Filtering ----------------------------------------------------------------------
+
+
+def gaussian_filter(data: np.ndarray, sigma: float) -> np.ndarray:
+    """Apply a Gaussian filter to 2D array `data`
+
+    The result is the same as :py:func:`scipy.ndimage.gaussian_filter` (with the
+    default "reflect" mode and a kernel truncated at 4 sigma). For single precision
+    floating point data, OpenCV's vectorized separable implementation is used if
+    available, which is much faster.
+
+    Args:
+        data: Input data
+        sigma: Standard deviation of the Gaussian kernel
+
+    Returns:
+        Filtered data
+    """
+    if data.ndim == 2 and data.dtype == np.float32 and sigma > 0:
+        try:
+            import cv2  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pass
+        else:
+            ksize = 2 * int(4.0 * sigma + 0.5) + 1
+            return cv2.GaussianBlur(
+                data,
+                (ksize, ksize),
+                sigmaX=sigma,
+                sigmaY=sigma,
+                borderType=cv2.BORDER_REFLECT,
+            )
+    return spi.gaussian_filter(data, sigma=sigma)
+
+
+#: Padding modes of :py:func:`numpy.pad` equivalent to :py:mod:`scipy.ndimage` modes
+NDIMAGE_TO_NUMPY_PAD_MODES = {
+    "reflect": "symmetric",
+    "constant": "constant",
+    "nearest": "edge",
+    "mirror": "reflect",
+    "wrap": "wrap",
+}
+
+
+def uniform_filter(
+    data: np.ndarray,
+    size: int,
+    mode: Literal["reflect", "constant", "nearest", "mirror", "wrap"] = "reflect",
+) -> np.ndarray:
+    """Apply a uniform (moving average) filter to 2D array `data`
+
+    The result is the same as :py:func:`scipy.ndimage.uniform_filter`. For floating
+    point data, OpenCV's vectorized box filter is used if available (except for the
+    "wrap" mode, which is not supported by OpenCV), which is much faster.
+
+    Args:
+        data: Input data
+        size: Size of the (square) moving window
+        mode: Boundary mode (see :py:func:`scipy.ndimage.uniform_filter`)
+
+    Returns:
+        Filtered data
+    """
+    if data.ndim == 2 and data.dtype in (np.float32, np.float64) and mode != "wrap":
+        try:
+            import cv2  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pass
+        else:
+            border_type = {
+                "reflect": cv2.BORDER_REFLECT,
+                "constant": cv2.BORDER_CONSTANT,
+                "nearest": cv2.BORDER_REPLICATE,
+                "mirror": cv2.BORDER_REFLECT_101,
+            }[mode]
+            return cv2.blur(data, (size, size), borderType=border_type)
+    return spi.uniform_filter(data, size=size, mode=mode)
+
+
+def median_filter(
+    data: np.ndarray,
+    size: int,
+    mode: Literal["reflect", "constant", "nearest", "mirror", "wrap"] = "reflect",
+) -> np.ndarray:
+    """Apply a median filter to 2D array `data`
+
+    The result is the same as :py:func:`scipy.ndimage.median_filter`. For 8-bit data
+    (or 16-bit data with a window size of 3 or 5), OpenCV's constant-time histogram
+    based implementation is used if available, which is much faster for large window
+    sizes.
+
+    Args:
+        data: Input data
+        size: Size of the (square) moving window
+        mode: Boundary mode (see :py:func:`scipy.ndimage.median_filter`)
+
+    Returns:
+        Filtered data
+    """
+    if (
+        data.ndim == 2
+        and size > 1
+        and size % 2 == 1
+        and (data.dtype == np.uint8 or (data.dtype == np.uint16 and size <= 5))
+    ):
+        try:
+            import cv2  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pass
+        else:
+            if mode == "nearest":  # OpenCV always replicates border pixels
+                return cv2.medianBlur(data, size)
+            radius = size // 2
+            padded = np.pad(data, radius, mode=NDIMAGE_TO_NUMPY_PAD_MODES[mode])
+            return cv2.medianBlur(padded, size)[radius:-radius, radius:-radius]
+    return spi.median_filter(data, size=size, mode=mode)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_butterworth_mask(
+    shape: tuple[int, ...], cut_off: float, order: float, high_pass: bool, dtype
+) -> np.ndarray:
+    """Return the (squared) Butterworth mask to be applied to the real FFT of an
+    array of shape `shape`, as in :py:func:`skimage.filters.butterworth`.
+
+    The mask only depends on the geometry and on the filter parameters, so it is
+    cached (the returned array is read-only). Each mask is as large as the spectrum,
+    hence only the last two masks are kept, which is enough when filtering a series
+    of images with the same settings.
+
+    Args:
+        shape: Shape of the input data
+        cut_off: Cut-off frequency ratio
+        order: Order of the filter
+        high_pass: If True, return a high-pass filter mask
+        dtype: Data type of the mask
+
+    Returns:
+        Butterworth mask
+    """
+    ranges = []
+    for size in shape:
+        # Start and stop ensures center of mask aligns with center of FFT
+        axis = np.arange(-(size - 1) // 2, (size - 1) // 2 + 1) / (size * cut_off)
+        ranges.append(np.fft.ifftshift(axis**2))
+    # Real FFT: the last axis is halved
+    ranges[-1] = ranges[-1][: shape[-1] // 2 + 1]
+    q2 = functools.reduce(np.add, np.meshgrid(*ranges, indexing="ij", sparse=True))
+    q2 = np.power(q2.astype(dtype), order)
+    mask = 1 / (1 + q2)
+    if high_pass:
+        mask *= q2
+    mask.setflags(write=False)
+    return mask
+
+
+def butterworth(
+    data: np.ndarray, cut_off: float, high_pass: bool = False, order: float = 2.0
+) -> np.ndarray:
+    """Apply a Butterworth filter to real array `data`
+
+    The result is the same as :py:func:`skimage.filters.butterworth`, but the filter
+    mask is cached (see :py:func:`_get_butterworth_mask`) and the FFTs are computed
+    using all available CPU cores.
+
+    Args:
+        data: Input data
+        cut_off: Cut-off frequency ratio (between 0 and 0.5)
+        high_pass: If True, apply a high-pass filter instead of a low-pass filter
+        order: Order of the filter
+
+    Returns:
+        Filtered data
+
+    Raises:
+        ValueError: If `cut_off` is not in the range [0, 0.5]
+    """
+    if cut_off < 0 or cut_off > 0.5:
+        raise ValueError("Cut-off frequency ratio should be in the range [0, 0.5]")
+    if np.iscomplexobj(data):
+        return filters.butterworth(data, cut_off, high_pass, order)
+    # Same floating point precision as scikit-image:
+    dtype = np.float32 if data.dtype in (np.float16, np.float32) else np.float64
+    mask = _get_butterworth_mask(data.shape, cut_off, order, high_pass, dtype)
+    spectrum = spfft.rfftn(data, workers=-1)
+    spectrum *= mask
+    return spfft.irfftn(spectrum, s=data.shape, workers=-1)
+
+
 # MARK: Fourier analysis ---------------------------------------------------------------
 
 
@@ -125,7 +317,7 @@ def fft2d(z: np.ndarray, shift: bool = True) -> np.ndarray:
     Returns:
         FFT of input data
     """
-    z1 = np.fft.fft2(z)
+    z1 = spfft.fft2(z, workers=-1)
     if shift:
         z1 = np.fft.fftshift(z1)
     return z1
@@ -143,52 +335,146 @@ def ifft2d(z: np.ndarray, shift: bool = True) -> np.ndarray:
     """
     if shift:
         z = np.fft.ifftshift(z)
-    z1 = np.fft.ifft2(z)
+    z1 = spfft.ifft2(z, workers=-1)
     return z1
 
 
-def magnitude_spectrum(z: np.ndarray, log_scale: bool = False) -> np.ndarray:
+def _apply_to_spectrum(
+    z: np.ndarray,
+    spectrum: np.ndarray | None,
+    func: Callable[[np.ndarray], np.ndarray],
+    odd: bool = False,
+) -> np.ndarray:
+    """Apply function `func` to the (shifted) FFT of `z`
+
+    For real input data, the spectrum is Hermitian: `func` is then only applied to
+    the non-redundant half computed by the real FFT, and its result is mirrored to
+    the other half.
+
+    Args:
+        z: Input data
+        spectrum: FFT of input data, as returned by :func:`fft2d` (computed if None)
+        func: Function to be applied to the spectrum (element-wise)
+        odd: If True, `func` is odd with respect to complex conjugation
+         (e.g. phase), otherwise it is even (e.g. modulus)
+
+    Returns:
+        Result of `func` applied to the (shifted) FFT of `z`
+    """
+    if spectrum is not None:
+        return func(spectrum)
+    if not np.isrealobj(z):
+        return func(fft2d(z))
+    rows, cols = z.shape
+    half = func(spfft.rfft2(z, workers=-1))
+    ncols = half.shape[1]
+    result = np.empty((rows, cols), dtype=half.dtype)
+    result[:, :ncols] = half
+    # F(-u, -v) = conj(F(u, v)): columns beyond the real FFT output are mirrored
+    mirror = half[np.ix_(-np.arange(rows) % rows, cols - np.arange(ncols, cols))]
+    result[:, ncols:] = -mirror if odd else mirror
+    return np.fft.fftshift(result)
+
+
+def magnitude_spectrum(
+    z: np.ndarray, log_scale: bool = False, spectrum: np.ndarray | None = None
+) -> np.ndarray:
     """Compute magnitude spectrum of complex array `z`
 
     Args:
         z: Input data
         log_scale: Use log scale (default: False)
+        spectrum: FFT of input data, as returned by :func:`fft2d` (default: None,
+         i.e. computed from `z`), e.g. to share it with :func:`phase_spectrum`
+         and :func:`psd`
 
     Returns:
         Magnitude spectrum of input data
     """
-    z1 = np.abs(fft2d(z))
-    if log_scale:
-        z1 = 20 * np.log10(z1.clip(1e-10))
-    return z1
+
+    def func(sp: np.ndarray) -> np.ndarray:
+        z1 = np.abs(sp)
+        if log_scale:  # In-place operations: no temporary array
+            np.log10(z1.clip(1e-10, out=z1), out=z1)
+            z1 *= 20
+        return z1
+
+    return _apply_to_spectrum(z, spectrum, func)
 
 
-def phase_spectrum(z: np.ndarray) -> np.ndarray:
+def phase_spectrum(z: np.ndarray, spectrum: np.ndarray | None = None) -> np.ndarray:
     """Compute phase spectrum of complex array `z`
 
     Args:
         z: Input data
+        spectrum: FFT of input data, as returned by :func:`fft2d` (default: None,
+         i.e. computed from `z`)
 
     Returns:
         Phase spectrum of input data (in degrees)
     """
-    return np.rad2deg(np.angle(fft2d(z)))
 
+    def func(sp: np.ndarray) -> np.ndarray:
+        z1 = np.angle(sp)
+        return np.rad2deg(z1, out=z1)
 
-def psd(z: np.ndarray, log_scale: bool = False) -> np.ndarray:
+    return _apply_to_spectrum(z, spectrum, func, odd=True)
+
+
+def psd(
+    z: np.ndarray, log_scale: bool = False, spectrum: np.ndarray | None = None
+) -> np.ndarray:
     """Compute power spectral density of complex array `z`
 
     Args:
         z: Input data
         log_scale: Use log scale (default: False)
+        spectrum: FFT of input data, as returned by :func:`fft2d` (default: None,
+         i.e. computed from `z`)
 
     Returns:
         Power spectral density of input data
     """
-    z1 = np.abs(fft2d(z)) ** 2
-    if log_scale:
-        z1 = 10 * np.log10(z1.clip(1e-10))
-    return z1
+
+    def func(sp: np.ndarray) -> np.ndarray:
+        z1 = np.abs(sp)
+        np.square(z1, out=z1)
+        if log_scale:  # In-place operations: no temporary array
+            np.log10(z1.clip(1e-10, out=z1), out=z1)
+            z1 *= 10
+        return z1
+
+    return _apply_to_spectrum(z, spectrum, func)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_gaussian_bandpass_mask(
+    shape: tuple[int, int], f0: float, sigma: float, real: bool
+) -> np.ndarray:
+    """Return the 2D Gaussian bandpass mask to be applied to the (unshifted) FFT of
+    an array of shape `shape`.
+
+    Computing the radial frequency map and its exponential costs about as much as
+    the FFTs themselves: the mask is reused as long as the image size and the filter
+    settings do not change (the returned array is read-only, and only the last two
+    masks are kept in memory).
+
+    Args:
+        shape: Shape of the input data
+        f0: Center frequency of the Gaussian filter (cycles/pixel)
+        sigma: Standard deviation of the Gaussian filter (cycles/pixel)
+        real: If True, return the mask for the real FFT (last axis halved)
+
+    Returns:
+        Gaussian bandpass mask
+    """
+    n, m = shape
+    fx = np.fft.rfftfreq(m) if real else np.fft.fftfreq(m)
+    fy = np.fft.fftfreq(n)
+    freq_radius = np.hypot(fx[np.newaxis, :], fy[:, np.newaxis])
+    mask = np.exp(-0.5 * ((freq_radius - f0) / sigma) ** 2)
+    mask.setflags(write=False)
+    return mask
 
 
 def freq_fft_filter(
@@ -219,28 +505,26 @@ def freq_fft_filter(
     """
     if zin.ndim != 2:
         raise ValueError("Input image 'zin' must be a 2D array")
+    if ifft_result_type not in ("real", "abs"):
+        raise ValueError(
+            f"Invalid ifft_result_type: {ifft_result_type!r} (must be 'real' or 'abs')"
+        )
 
-    n, m = zin.shape
-    fx = np.fft.fftshift(np.fft.fftfreq(m, d=1))
-    fy = np.fft.fftshift(np.fft.fftfreq(n, d=1))
-    fx_grid, fy_grid = np.meshgrid(fx, fy)
-    freq_radius = np.hypot(fx_grid, fy_grid)
-
-    # Create the 2D Gaussian bandpass filter
-    gaussian_filter = np.exp(-0.5 * ((freq_radius - f0) / sigma) ** 2)
+    # Computations are done in double precision, whatever the input data type
+    zin = np.asarray(zin, dtype=np.result_type(zin.dtype, np.float64))
 
     # Apply FFT, filter in frequency domain, and inverse FFT
-    fft_data = fft2d(zin, shift=True)
-    filtered_fft = fft_data * gaussian_filter
-    zout = ifft2d(filtered_fft, shift=True)
-
-    if ifft_result_type == "real":
-        return zout.real
-    if ifft_result_type == "abs":
-        return np.abs(zout)
-    raise ValueError(
-        f"Invalid ifft_result_type: {ifft_result_type!r} (must be 'real' or 'abs')"
-    )
+    if np.iscomplexobj(zin):
+        mask = _get_gaussian_bandpass_mask(zin.shape, f0, sigma, real=False)
+        zout = spfft.ifft2(spfft.fft2(zin, workers=-1) * mask, workers=-1)
+        return zout.real if ifft_result_type == "real" else np.abs(zout)
+    # Real input: the mask is radially symmetric, so the filtered spectrum is
+    # Hermitian and the inverse FFT is real (only half of the spectrum is needed)
+    mask = _get_gaussian_bandpass_mask(zin.shape, f0, sigma, real=True)
+    spectrum = spfft.rfft2(zin, workers=-1)
+    spectrum *= mask
+    zout = spfft.irfft2(spectrum, s=zin.shape, workers=-1)
+    return zout if ifft_result_type == "real" else np.abs(zout)
 
 
 # MARK: Binning ------------------------------------------------------------------------
@@ -275,7 +559,7 @@ def binning(
     except ValueError as err:
         raise ValueError("Binning is not a multiple of image dimensions") from err
     if operation == "sum":
-        bdata = np.array(bdata, dtype=float).sum(axis=(-1, 1))
+        bdata = np.asarray(bdata).sum(axis=(-1, 1), dtype=float)
     elif operation == "average":
         bdata = bdata.mean(axis=(-1, 1))
     elif operation == "median":
@@ -318,6 +602,24 @@ def flatfield(
 # MARK: Misc. analyses -----------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=32)
+def _get_fourier_centroid_weights(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the cosine and sine weights used by :func:`get_centroid_fourier` along
+    an axis of length `size` (cached, read-only arrays)
+
+    Args:
+        size: Axis length (at least 2)
+
+    Returns:
+        Tuple (cos, sin) of 1D arrays
+    """
+    angles = (np.arange(size) - 1) * 2 * np.pi / (size - 1)
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos.setflags(write=False)
+    sin.setflags(write=False)
+    return cos, sin
+
+
 def get_centroid_fourier(data: np.ndarray) -> tuple[float, float]:
     """Return image centroid using Fourier algorithm
 
@@ -332,19 +634,22 @@ def get_centroid_fourier(data: np.ndarray) -> tuple[float, float]:
     rows, cols = data.shape
     if rows == 1 or cols == 1:
         return 0, 0
-
-    i = np.arange(0, rows).reshape(1, rows)
-    sin_a = np.sin((i - 1) * 2 * np.pi / (rows - 1)).T
-    cos_a = np.cos((i - 1) * 2 * np.pi / (rows - 1)).T
-
-    j = np.arange(0, cols).reshape(cols, 1)
-    sin_b = np.sin((j - 1) * 2 * np.pi / (cols - 1)).T
-    cos_b = np.cos((j - 1) * 2 * np.pi / (cols - 1)).T
-
-    a = np.nansum((cos_a * data))
-    b = np.nansum((sin_a * data))
-    c = np.nansum((data * cos_b))
-    d = np.nansum((data * sin_b))
+    if isinstance(data, ma.MaskedArray):
+        if ma.getmaskarray(data).all():
+            return np.nan, np.nan
+        data = data.filled(0)
+
+    # Only the first Fourier coefficient of the row and column profiles is needed:
+    # the image is reduced to those profiles first (NaNs are ignored)
+    row_profile = np.nansum(data, axis=1, dtype=float)
+    col_profile = np.nansum(data, axis=0, dtype=float)
+    cos_a, sin_a = _get_fourier_centroid_weights(rows)
+    cos_b, sin_b = _get_fourier_centroid_weights(cols)
+
+    a = row_profile.dot(cos_a)
+    b = row_profile.dot(sin_a)
+    c = col_profile.dot(cos_b)
+    d = col_profile.dot(sin_b)
 
     rphi = (0 if b > 0 else 2 * np.pi) if a > 0 else np.pi
     cphi = (0 if d > 0 else 2 * np.pi) if c > 0 else np.pi
@@ -355,9 +660,6 @@ def get_centroid_fourier(data: np.ndarray) -> tuple[float, float]:
     row = (np.arctan(b / a) + rphi) * (rows - 1) / (2 * np.pi) + 1
     col = (np.arctan(d / c) + cphi) * (cols - 1) / (2 * np.pi) + 1
 
-    row = np.nan if row is np.ma.masked else row
-    col = np.nan if col is np.ma.masked else col
-
     return row, col
 
 
@@ -37,19 +37,22 @@ def find_first_x_at_y_value(x: np.ndarray, y: np.ndarray, y_value: float) -> flo
     if y_value < np.nanmin(y) or y_value > np.nanmax(y):
         return np.nan  # out of bounds
 
-    for i in range(len(y) - 1):
-        y1, y2 = y[i], y[i + 1]
-        if np.isnan(y1) or np.isnan(y2):
-            continue  # skip bad segments
-
-        if (y1 <= y_value <= y2) or (y2 <= y_value <= y1):
-            x1, x2 = x[i], x[i + 1]
-            if y1 == y2:
-                return x1  # flat segment, arbitrary choice
-            # Linear interpolation
-            return x1 + (y_value - y1) * (x2 - x1) / (y2 - y1)
-
-    return np.nan  # not found
+    # Segments containing the value (comparisons with NaN are always False, so that
+    # bad segments are skipped)
+    y_left, y_right = y[:-1], y[1:]
+    (indices,) = np.nonzero(
+        ((y_left <= y_value) & (y_value <= y_right))
+        | ((y_right <= y_value) & (y_value <= y_left))
+    )
+    if indices.size == 0:
+        return np.nan  # not found
+
+    i = indices[0]
+    x1, x2, y1, y2 = x[i], x[i + 1], y[i], y[i + 1]
+    if y1 == y2:
+        return x1  # flat segment, arbitrary choice
+    # Linear interpolation
+    return x1 + (y_value - y1) * (x2 - x1) / (y2 - y1)
 
 
 def find_y_at_x_value(x: np.ndarray, y: np.ndarray, x_value: float) -> float:
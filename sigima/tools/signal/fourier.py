@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Literal
 
 import numpy as np
+import scipy.fft as spfft
 import scipy.signal
 
 from sigima.tools.signal.dynamic import sampling_rate
@@ -50,7 +51,7 @@ def fft1d(
     """
     dt = x[1] - x[0]
     f = np.fft.fftfreq(x.size, d=dt)  # Frequency axis
-    sp = np.fft.fft(y)  # Spectrum values
+    sp = spfft.fft(y, workers=-1)  # Spectrum values
     if shift:
         f = np.fft.fftshift(f)
         sp = np.fft.fftshift(sp)
@@ -91,7 +92,7 @@ def ifft1d(
     if not np.allclose(diff_f, df):
         raise ValueError("Frequency array must be evenly spaced.")
 
-    y = np.fft.ifft(sp)
+    y = spfft.ifft(sp, workers=-1)
     dt = 1.0 / (f.size * df)
     x = np.linspace(initial, initial + (y.size - 1) * dt, y.size)
 